@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 # system imports
+import ast
 import code
-import contextlib
 import copy
 import gettext
 import importlib
@@ -33,6 +33,28 @@ if typing.TYPE_CHECKING:
 _ = gettext.gettext
 
 
+class _RedirectStdStreams:
+    """Redirect stdout and stderr together; cheaper than nesting the contextlib redirect managers per command."""
+    __slots__ = ("__stdout", "__stderr", "__old_stdout", "__old_stderr")
+
+    def __init__(self, stdout: typing.TextIO, stderr: typing.TextIO) -> None:
+        self.__stdout = stdout
+        self.__stderr = stderr
+        self.__old_stdout: typing.Optional[typing.TextIO] = None
+        self.__old_stderr: typing.Optional[typing.TextIO] = None
+
+    def __enter__(self) -> _RedirectStdStreams:
+        self.__old_stdout, self.__old_stderr = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = self.__stdout, self.__stderr
+        return self
+
+    def __exit__(self, exception_type: typing.Optional[typing.Type[BaseException]], value: typing.Optional[BaseException], traceback: typing.Optional[types.TracebackType]) -> typing.Optional[bool]:
+        # restore the streams unconditionally; exceptions are not suppressed.
+        sys.stdout, sys.stderr = typing.cast(typing.TextIO, self.__old_stdout), typing.cast(typing.TextIO, self.__old_stderr)
+        self.__old_stdout = self.__old_stderr = None
+        return None
+
+
 class ConsoleWidgetStateController:
     delims = " \t\n`~!@#$%^&*()-=+[{]}\\|;:\'\",<>/?"
 
@@ -69,16 +91,42 @@ class ConsoleWidgetStateController:
         self.__command_cache = (None, str())
         output = io.StringIO()
         error = io.StringIO()
-        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(error):
+        with _RedirectStdStreams(output, error):
             self.__incomplete = self.__console.push(command)
-        if error.getvalue():
-            result =  error.getvalue()
+        # the buffers are created per command, so each is read exactly once and then discarded.
+        result = error.getvalue()
+        if result:
             error_code = -1
         else:
             result = output.getvalue()
             error_code = 0
         return result, error_code
 
+    def execute_lines(self, lines: typing.Sequence[str]) -> typing.Tuple[str, int]:
+        # parse the lines as one block and run its statements directly, avoiding a push and output redirection per
+        # line. the lines are added to the history as if they had been typed. each statement runs once; one that
+        # raises is reported in the result and does not prevent the remaining statements.
+        try:
+            module = ast.parse("\n".join(lines) + "\n", "<console>", "exec")
+        except (OverflowError, SyntaxError, ValueError):
+            # not valid as a block (nothing has run yet); interpret the lines one at a time as if typed.
+            results = [self.interpret_command(line) for line in lines]
+            errors = "".join(result for result, error_code in results if error_code)
+            return (errors, -1) if errors else ("".join(result for result, error_code in results), 0)
+        self.__history.extend(line for line in lines if line)
+        self.__history_point = None
+        self.__command_cache = (None, str())
+        output = io.StringIO()
+        error = io.StringIO()
+        with _RedirectStdStreams(output, error):
+            for statement in module.body:
+                self.__console.runcode(compile(ast.Interactive(body=[statement]), "<console>", "single"))
+        self.__incomplete = False
+        result = error.getvalue()
+        if result:
+            return result, -1
+        return output.getvalue(), 0
+
     def complete_command(self, command: str) -> typing.Tuple[str, typing.List[str]]:
         terms = list()
         completed_command = command
@@ -216,8 +264,14 @@ class ConsoleWidget(Widgets.CompositeWidgetBase):
             self.__last_cursor_position = copy.deepcopy(self.__cursor_position)
 
     def interpret_lines(self, lines: typing.Sequence[str]) -> None:
-        for l in lines:
-            self.__state_controller.interpret_command(l)
+        result, error_code = self.__state_controller.execute_lines(lines)
+        if error_code:
+            self.__text_edit_widget.set_text_color("red")
+            self.__text_edit_widget.append_text(result[:-1])
+            self.__text_edit_widget.set_text_color("white")
+            self.__text_edit_widget.append_text(self.current_prompt)
+            self.__text_edit_widget.move_cursor_position("end")
+            self.__last_cursor_position = copy.deepcopy(self.__cursor_position)
 
     def __return_pressed(self) -> bool:
         command = self.__get_partial_command()
@@ -1675,7 +1675,7 @@ class DocumentController(Window.Window):
             workspace_controller = self.__document_controller.workspace_controller
             self.__old_workspace_layout: typing.Optional[Persistence.PersistentDictType] = workspace_controller.deconstruct() if workspace_controller else None
             self.__new_workspace_layout: typing.Optional[Persistence.PersistentDictType] = None
-            self.__graphic_indexes = [display_item.graphics.index(graphic) for graphic in graphics]
+            self.__graphic_indexes = [display_item.item_index("graphics", graphic) for graphic in graphics]
             self.__undelete_logs: typing.List[Changes.UndeleteLog] = list()
             self.initialize()
 
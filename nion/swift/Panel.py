@@ -141,9 +141,12 @@ class OutputPanel(Panel):
             def __init__(self, out: typing.TextIO) -> None:
                 self.__out = out
             def write(self, stuff: typing.Any) -> None:
-                for stdout_listener in stdout_listeners.values():
-                    stdout_listener(stuff)
-                self.__out.write(stuff)
+                # always pass the output through to the original stream, even if a listener fails.
+                try:
+                    for stdout_listener in list(stdout_listeners.values()):
+                        stdout_listener(stuff)
+                finally:
+                    self.__out.write(stuff)
             def flush(self) -> None:
                 self.__out.flush()
             def getvalue(self) -> typing.Any:
@@ -174,32 +177,42 @@ class OutputPanel(Panel):
         text_edit_widget.set_line_height_proportional(Panel.get_monospace_proportional_line_height())
         self.__lock = threading.RLock()
         self.__q = collections.deque()  # type: ignore  # Python 3.9+: collections.deque[str]
+        self.__emit_pending = False
 
         def safe_emit() -> None:
+            # drain all queued messages and append them to the widget in a single call.
             with self.__lock:
-                while len(self.__q) > 0:
-                    text_edit_widget.move_cursor_position("end")
-                    text_edit_widget.append_text(self.__q.popleft())
+                messages = list(self.__q)
+                self.__q.clear()
+                self.__emit_pending = False
+            if messages:
+                text_edit_widget.move_cursor_position("end")
+                text_edit_widget.append_text("\n".join(messages))
 
         def queue_message(message: str) -> None:
             with self.__lock:
                 self.__q.append(message.strip())
+                emit_pending = self.__emit_pending
+                self.__emit_pending = True
             if threading.current_thread().name == "MainThread":
                 safe_emit()
-            else:
+            elif not emit_pending:
+                # only queue one task per burst of messages from other threads; the task drains the queue.
                 self.document_controller.queue_task(safe_emit)
 
         class OutputPanelHandler(logging.Handler):
 
             def __init__(self, queue_message_fn: typing.Callable[[str], None], records: typing.Sequence[logging.LogRecord]) -> None:
-                super().__init__()
+                super().__init__(logging.INFO)
                 self.queue_message_fn = queue_message_fn
+                # records taken from the startup handler bypass the logger; apply the level here.
                 for record in records or list():
-                    self.emit(record)
+                    if record.levelno >= self.level:
+                        self.emit(record)
 
             def emit(self, record: logging.LogRecord) -> None:
-                if record.levelno >= logging.INFO:
-                    self.queue_message_fn(record.getMessage())
+                # the logging framework only dispatches records at or above the handler level.
+                self.queue_message_fn(record.getMessage())
 
         self.__output_panel_handler = OutputPanelHandler(queue_message, Application.logging_handler.take_records())
 
@@ -245,6 +258,8 @@ class HeaderCanvasItem(CanvasItem.CanvasItemComposition):
         self.on_context_menu_clicked: typing.Optional[typing.Callable[[int, int, int, int], bool]] = None
         self.on_double_clicked: typing.Optional[typing.Callable[[int, int, UserInterface.KeyboardModifiers], bool]] = None
         self.__mouse_pressed_position: typing.Optional[Geometry.IntPoint] = None
+        # the background gradient depends only on the size and colors; reuse it across repaints.
+        self.__gradient_cache: typing.Optional[typing.Tuple[typing.Tuple[int, int, str, str], DrawingContext.LinearGradient]] = None
 
     def close(self) -> None:
         self.on_select_pressed = None
@@ -372,23 +387,28 @@ class HeaderCanvasItem(CanvasItem.CanvasItemComposition):
             return self.on_context_menu_clicked(x, y, gx, gy)
         return False
 
+    def __get_gradient(self, drawing_context: DrawingContext.DrawingContext, canvas_size: Geometry.IntSize) -> DrawingContext.LinearGradient:
+        gradient_key = (canvas_size.width, canvas_size.height, self.__start_header_color, self.__end_header_color)
+        gradient_cache = self.__gradient_cache
+        if gradient_cache and gradient_cache[0] == gradient_key:
+            return gradient_cache[1]
+        gradient = drawing_context.create_linear_gradient(canvas_size.width, canvas_size.height, 0, 0, 0, canvas_size.height)
+        gradient.add_color_stop(0, self.__start_header_color)
+        gradient.add_color_stop(1, self.__end_header_color)
+        self.__gradient_cache = gradient_key, gradient
+        return gradient
+
     def _repaint(self, drawing_context: DrawingContext.DrawingContext) -> None:
         canvas_size = self.canvas_size
         if canvas_size:
+            # draw everything within a single save/restore; each step sets the state it depends on and the
+            # steps are ordered so that no step depends on state left over from an earlier one.
             with drawing_context.saver():
                 drawing_context.begin_path()
-                drawing_context.move_to(0, 1)
-                drawing_context.line_to(0, canvas_size.height)
-                drawing_context.line_to(canvas_size.width, canvas_size.height)
-                drawing_context.line_to(canvas_size.width, 1)
-                drawing_context.close_path()
-                gradient = drawing_context.create_linear_gradient(canvas_size.width, canvas_size.height, 0, 0, 0, canvas_size.height)
-                gradient.add_color_stop(0, self.__start_header_color)
-                gradient.add_color_stop(1, self.__end_header_color)
-                drawing_context.fill_style = gradient
+                drawing_context.rect(0, 1, canvas_size.width, canvas_size.height - 1)
+                drawing_context.fill_style = self.__get_gradient(drawing_context, canvas_size)
                 drawing_context.fill()
 
-            with drawing_context.saver():
                 drawing_context.begin_path()
                 # line is adjust 1/2 pixel down to align to pixel boundary
                 drawing_context.move_to(0, 0.5 + self.__top_offset)
@@ -396,7 +416,6 @@ class HeaderCanvasItem(CanvasItem.CanvasItemComposition):
                 drawing_context.stroke_style = self.__top_stroke_style
                 drawing_context.stroke()
 
-            with drawing_context.saver():
                 drawing_context.begin_path()
                 # line is adjust 1/2 pixel down to align to pixel boundary
                 drawing_context.move_to(0, canvas_size.height-0.5)
@@ -404,8 +423,7 @@ class HeaderCanvasItem(CanvasItem.CanvasItemComposition):
                 drawing_context.stroke_style = self.__bottom_stroke_style
                 drawing_context.stroke()
 
-            if self.__side_stroke_style:
-                with drawing_context.saver():
+                if self.__side_stroke_style:
                     drawing_context.begin_path()
                     # line is adjust 1/2 pixel down to align to pixel boundary
                     drawing_context.move_to(0.5, 1.5)
@@ -415,8 +433,7 @@ class HeaderCanvasItem(CanvasItem.CanvasItemComposition):
                     drawing_context.stroke_style = self.__side_stroke_style
                     drawing_context.stroke()
 
-            if self.__display_close_control:
-                with drawing_context.saver():
+                if self.__display_close_control:
                     drawing_context.begin_path()
                     close_box_left = canvas_size.width - (20 - 7)
                     close_box_right = canvas_size.width - (20 - 13)
@@ -431,17 +448,13 @@ class HeaderCanvasItem(CanvasItem.CanvasItemComposition):
                     drawing_context.stroke_style = self.__control_style
                     drawing_context.stroke()
 
-            with drawing_context.saver():
                 drawing_context.font = self.__font
-                drawing_context.text_align = 'left'
                 drawing_context.text_baseline = 'bottom'
+                drawing_context.text_align = 'left'
                 drawing_context.fill_style = '#888'
                 drawing_context.fill_text(self.label, 8, canvas_size.height - self.__text_offset)
 
-            with drawing_context.saver():
-                drawing_context.font = self.__font
                 drawing_context.text_align = 'center'
-                drawing_context.text_baseline = 'bottom'
                 drawing_context.fill_style = '#000'
                 drawing_context.fill_text(self.title, canvas_size.width // 2, canvas_size.height - self.__text_offset)
 
@@ -7,7 +7,9 @@ from __future__ import annotations
 # standard libraries
 import copy
 import functools
+import threading
 import typing
+import uuid
 
 # third party libraries
 # None
@@ -24,6 +26,21 @@ if typing.TYPE_CHECKING:
 
 _SpecifierType = typing.Dict[str, typing.Any]
 
+# marks a missing attribute so that the first assignment of any value (including None) is never skipped.
+_NO_VALUE = object()
+
+_INTERVAL_DESCRIPTOR_COLOR = "#F00"
+
+
+def _is_same_value(current_value: typing.Any, value: typing.Any) -> bool:
+    if current_value is _NO_VALUE:
+        return False
+    try:
+        return bool(current_value == value)
+    except Exception:
+        # values such as arrays do not compare to a single bool; treat them as changed.
+        return False
+
 
 class Connection(Persistence.PersistentObject):
     """ Represents a connection between two objects. """
@@ -68,11 +85,17 @@ class Connection(Persistence.PersistentObject):
 
     @parent.setter
     def parent(self, parent: typing.Optional[Persistence.PersistentObject]) -> None:
+        if parent is not None and parent is self.__parent_reference.item:
+            return
         self.__parent_reference.item = parent
         self.parent_specifier = Persistence.write_persistent_specifier(parent.uuid) if parent else None
 
     def __parent_specifier_changed(self, name: str, d: _SpecifierType) -> None:
-        self.__parent_reference.item_specifier = Persistence.read_persistent_specifier(d)
+        # skip when the reference already refers to this item (for instance, when it was passed directly);
+        # setting the specifier again would drop the item and resolve it again.
+        item_specifier = Persistence.read_persistent_specifier(d)
+        if item_specifier != self.__parent_reference.item_specifier:
+            self.__parent_reference.item_specifier = item_specifier
 
 
 class PropertyConnection(Connection):
@@ -93,42 +116,14 @@ class PropertyConnection(Connection):
         self.__target_property_changed_listener: typing.Optional[Event.EventListener] = None
         self.__source_reference = self.create_item_reference(item=source)
         self.__target_reference = self.create_item_reference(item=target)
-        # suppress messages while we're setting source or target
-        self.__suppress = False
+        # suppress messages while we're setting source or target; tracked per thread so that a propagation
+        # on one thread does not swallow an unrelated change arriving on another thread.
+        self.__suppressed_threads: typing.Set[int] = set()
         # set up the proxies
-
-        def configure_binding() -> None:
-            if self._source and self._target:
-                assert not self.__binding
-                self.__binding = Binding.PropertyBinding(self._source, self.source_property)
-                self.__binding.target_setter = self.__set_target_from_source
-                # while reading, the data item in the display data channel will not be connected;
-                # we still set its value here. when the data item becomes valid, it will update.
-                self.__binding.update_target_direct(self.__binding.get_target_value())
-
-        def release_binding() -> None:
-            if self.__binding:
-                self.__binding.close()
-                self.__binding = None
-            if self.__target_property_changed_listener:
-                self.__target_property_changed_listener.close()
-                self.__target_property_changed_listener = None
-
-        self.__source_reference.on_item_registered = lambda x: configure_binding()
-        self.__source_reference.on_item_unregistered = lambda x: release_binding()
-
-        def configure_target() -> None:
-            def property_changed(target: typing.Optional[Persistence.PersistentObject], property_name: str) -> None:
-                if property_name == self.target_property:
-                    self.__set_source_from_target(getattr(target, property_name))
-
-            assert self.__target_property_changed_listener is None
-            if self._target:
-                self.__target_property_changed_listener = self._target.property_changed_event.listen(functools.partial(property_changed, self._target))
-            configure_binding()
-
-        self.__target_reference.on_item_registered = lambda x: configure_target()
-        self.__target_reference.on_item_unregistered = lambda x: release_binding()
+        self.__source_reference.on_item_registered = self.__source_registered
+        self.__source_reference.on_item_unregistered = self.__item_unregistered
+        self.__target_reference.on_item_registered = self.__target_registered
+        self.__target_reference.on_item_unregistered = self.__item_unregistered
 
         # but set up if we were passed objects
         if source is not None:
@@ -141,16 +136,49 @@ class PropertyConnection(Connection):
             self.target_property = target_property
 
         if self._target:
-            configure_target()
+            self.__configure_target()
 
     def close(self) -> None:
+        self.__release_binding()
+        super().close()
+
+    def __configure_binding(self) -> None:
+        source = self._source
+        if source and self._target:
+            assert not self.__binding
+            self.__binding = Binding.PropertyBinding(source, self.source_property)
+            self.__binding.target_setter = self.__set_target_from_source
+            # while reading, the data item in the display data channel will not be connected;
+            # we still set its value here. when the data item becomes valid, it will update.
+            self.__binding.update_target_direct(self.__binding.get_target_value())
+
+    def __release_binding(self) -> None:
         if self.__binding:
             self.__binding.close()
             self.__binding = None
         if self.__target_property_changed_listener:
             self.__target_property_changed_listener.close()
             self.__target_property_changed_listener = None
-        super().close()
+
+    def __configure_target(self) -> None:
+        assert self.__target_property_changed_listener is None
+        target = self._target
+        if target:
+            self.__target_property_changed_listener = target.property_changed_event.listen(functools.partial(self.__target_property_changed, target))
+        self.__configure_binding()
+
+    def __source_registered(self, source: Persistence.PersistentObject) -> None:
+        self.__configure_binding()
+
+    def __target_registered(self, target: Persistence.PersistentObject) -> None:
+        self.__configure_target()
+
+    def __item_unregistered(self, item: Persistence.PersistentObject) -> None:
+        self.__release_binding()
+
+    def __target_property_changed(self, target: typing.Optional[Persistence.PersistentObject], property_name: str) -> None:
+        if property_name == self.target_property:
+            self.__set_source_from_target(getattr(target, property_name))
 
     @property
     def source_specifier(self) -> typing.Optional[Persistence._SpecifierType]:
@@ -209,25 +237,36 @@ class PropertyConnection(Connection):
         return self._target
 
     def __source_specifier_changed(self, name: str, d: _SpecifierType) -> None:
-        self.__source_reference.item_specifier = Persistence.read_persistent_specifier(d)
+        item_specifier = Persistence.read_persistent_specifier(d)
+        if item_specifier != self.__source_reference.item_specifier:
+            self.__source_reference.item_specifier = item_specifier
 
     def __target_specifier_changed(self, name: str, d: _SpecifierType) -> None:
-        self.__target_reference.item_specifier = Persistence.read_persistent_specifier(d)
+        item_specifier = Persistence.read_persistent_specifier(d)
+        if item_specifier != self.__target_reference.item_specifier:
+            self.__target_reference.item_specifier = item_specifier
 
     def __set_target_from_source(self, value: typing.Any) -> None:
         assert not self._closed
-        if not self.__suppress:
-            self.__suppress = True
-            setattr(self._target, self.target_property, value)
-            self.__suppress = False
+        # skip values the target already has so its listeners are not notified of a no-op change.
+        target = self._target
+        thread_id = threading.get_ident()
+        if thread_id not in self.__suppressed_threads and not _is_same_value(getattr(target, self.target_property, _NO_VALUE), value):
+            self.__suppressed_threads.add(thread_id)
+            try:
+                setattr(target, self.target_property, value)
+            finally:
+                self.__suppressed_threads.discard(thread_id)
 
     def __set_source_from_target(self, value: typing.Any) -> None:
         assert not self._closed
-        if not self.__suppress:
-            self.__suppress = True
-            if self.__binding:
+        thread_id = threading.get_ident()
+        if thread_id not in self.__suppressed_threads and self.__binding and not _is_same_value(getattr(self._source, self.source_property, _NO_VALUE), value):
+            self.__suppressed_threads.add(thread_id)
+            try:
                 self.__binding.update_source(value)
-            self.__suppress = False
+            finally:
+                self.__suppressed_threads.discard(thread_id)
 
 
 class IntervalListConnection(Connection):
@@ -245,40 +284,105 @@ class IntervalListConnection(Connection):
         # these are only set in persistent object context changed
         self.__item_inserted_event_listener: typing.Optional[Event.EventListener] = None
         self.__item_removed_event_listener: typing.Optional[Event.EventListener] = None
-        self.__interval_mutated_listeners: typing.List[Event.EventListener] = list()
+        # one listener per interval graphic, keyed by uuid so that a single graphic can be attached or detached.
+        self.__interval_mutated_listeners: typing.Dict[uuid.UUID, Event.EventListener] = dict()
+        # the interval graphics of the source in display order, the interval descriptors last built from them,
+        # and the index of each interval graphic within both.
+        self.__interval_graphics: typing.List[Graphics.IntervalGraphic] = list()
+        self.__interval_descriptors: typing.List[Persistence.PersistentDictType] = list()
+        self.__region_to_index: typing.Dict[uuid.UUID, int] = dict()
         self.__source_reference = self.create_item_reference(item=display_item)
         self.__target_reference = self.create_item_reference(item=line_profile)
 
         def detach() -> None:
-            for listener in self.__interval_mutated_listeners:
+            for listener in self.__interval_mutated_listeners.values():
                 listener.close()
-            self.__interval_mutated_listeners = list()
+            self.__interval_mutated_listeners.clear()
+            self.__region_to_index.clear()
+            self.__interval_graphics.clear()
+
+        def get_regions() -> typing.List[Graphics.IntervalGraphic]:
+            source = self._source
+            if isinstance(source, DisplayItem.DisplayItem):
+                return [region for region in source.graphics if isinstance(region, Graphics.IntervalGraphic)]
+            return list()
+
+        def update_target() -> None:
+            target = self._target
+            if isinstance(target, Graphics.LineProfileGraphic):
+                if target.interval_descriptors != self.__interval_descriptors:
+                    target.interval_descriptors = self.__interval_descriptors
+
+        def region_changed(region: Graphics.IntervalGraphic, name: str) -> None:
+            # only the interval is propagated; other property changes (and the start/end notifications that
+            # accompany an interval change) do not affect the descriptors. update the one descriptor in place.
+            if name != "interval":
+                return
+            index = self.__region_to_index.get(region.uuid)
+            if index is None:
+                reattach()
+                return
+            interval = region.interval
+            interval_descriptor = self.__interval_descriptors[index]
+            if interval_descriptor["interval"] != interval:
+                interval_descriptor["interval"] = interval
+                update_target()
+
+        def attach_region(region: Graphics.IntervalGraphic) -> None:
+            self.__interval_mutated_listeners[region.uuid] = region.property_changed_event.listen(functools.partial(region_changed, region))
 
         def reattach() -> None:
+            # full rebuild; only needed when the items are registered or the incremental state is out of sync.
             detach()
-            interval_descriptors = list()
-            if isinstance(self._source, DisplayItem.DisplayItem):
-                for region in self._source.graphics:
-                    if isinstance(region, Graphics.IntervalGraphic):
-                        interval_descriptor = {"interval": region.interval, "color": "#F00"}
-                        interval_descriptors.append(interval_descriptor)
-                        self.__interval_mutated_listeners.append(region.property_changed_event.listen(lambda k: reattach()))
-            if isinstance(self._target, Graphics.LineProfileGraphic):
-                if self._target.interval_descriptors != interval_descriptors:
-                    self._target.interval_descriptors = interval_descriptors
+            regions = get_regions()
+            self.__interval_graphics = regions
+            for region in regions:
+                attach_region(region)
+            self.__region_to_index = {region.uuid: index for index, region in enumerate(regions)}
+            intervals = [region.interval for region in regions]
+            # keep the existing descriptors when re-registering items has not changed any interval.
+            if intervals != [interval_descriptor["interval"] for interval_descriptor in self.__interval_descriptors]:
+                self.__interval_descriptors = [{"interval": interval, "color": _INTERVAL_DESCRIPTOR_COLOR} for interval in intervals]
+            update_target()
 
         def item_inserted(key: str, value: typing.Any, before_index: int) -> None:
-            if key == "graphics" and self._target:
-                reattach()
+            # only interval graphics contribute descriptors; attach just the inserted one.
+            if key == "graphics" and self._target and isinstance(value, Graphics.IntervalGraphic):
+                source = self._source
+                if value.uuid in self.__interval_mutated_listeners or not isinstance(source, DisplayItem.DisplayItem):
+                    reattach()
+                    return
+                # the inserted graphic goes after the interval graphics that precede it in the display.
+                region_index = 0
+                for region in self.__interval_graphics:
+                    if source.item_index("graphics", region) >= before_index:
+                        break
+                    region_index += 1
+                attach_region(value)
+                self.__interval_graphics.insert(region_index, value)
+                self.__interval_descriptors.insert(region_index, {"interval": value.interval, "color": _INTERVAL_DESCRIPTOR_COLOR})
+                self.__region_to_index = {region.uuid: index for index, region in enumerate(self.__interval_graphics)}
+                update_target()
 
         def item_removed(key: str, value: typing.Any, index: int) -> None:
-            if key == "graphics" and self._target:
-                reattach()
+            # only interval graphics contribute descriptors; detach just the removed one.
+            if key == "graphics" and self._target and isinstance(value, Graphics.IntervalGraphic):
+                listener = self.__interval_mutated_listeners.pop(value.uuid, None)
+                region_index = self.__region_to_index.get(value.uuid)
+                if listener is None or region_index is None:
+                    reattach()
+                    return
+                listener.close()
+                del self.__interval_graphics[region_index]
+                del self.__interval_descriptors[region_index]
+                self.__region_to_index = {region.uuid: index for index, region in enumerate(self.__interval_graphics)}
+                update_target()
 
         def source_registered(source: Persistence.PersistentObject) -> None:
-            if self._source:
-                self.__item_inserted_event_listener = self._source.item_inserted_event.listen(item_inserted)
-                self.__item_removed_event_listener = self._source.item_removed_event.listen(item_removed)
+            source_item = self._source
+            if source_item:
+                self.__item_inserted_event_listener = source_item.item_inserted_event.listen(item_inserted)
+                self.__item_removed_event_listener = source_item.item_removed_event.listen(item_removed)
             reattach()
 
         def target_registered(target: Persistence.PersistentObject) -> None:
@@ -335,16 +439,23 @@ class IntervalListConnection(Connection):
         return self.__target_reference.item
 
     def __source_specifier_changed(self, name: str, d: _SpecifierType) -> None:
-        self.__source_reference.item_specifier = Persistence.read_persistent_specifier(d)
+        item_specifier = Persistence.read_persistent_specifier(d)
+        if item_specifier != self.__source_reference.item_specifier:
+            self.__source_reference.item_specifier = item_specifier
 
     def __target_specifier_changed(self, name: str, d: _SpecifierType) -> None:
-        self.__target_reference.item_specifier = Persistence.read_persistent_specifier(d)
+        item_specifier = Persistence.read_persistent_specifier(d)
+        if item_specifier != self.__target_reference.item_specifier:
+            self.__target_reference.item_specifier = item_specifier
+
+
+# built once rather than on each call; the factory is called for every connection read from a project.
+_connection_build_map: typing.Dict[str, typing.Callable[[], Connection]] = {
+    "property-connection": PropertyConnection,
+    "interval-list-connection": IntervalListConnection,
+}
 
 
 def connection_factory(lookup_id: typing.Callable[[str], str]) -> typing.Optional[Connection]:
-    build_map = {
-        "property-connection": PropertyConnection,
-        "interval-list-connection": IntervalListConnection,
-    }
-    type = lookup_id("type")
-    return build_map[type]() if type in build_map else None
+    build_fn = _connection_build_map.get(lookup_id("type"))
+    return build_fn() if build_fn is not None else None
@@ -242,12 +242,15 @@ class DataItem(Persistence.PersistentObject):
         self.__change_count_lock = threading.RLock()
         self.__change_changed = False
         self.__change_data_changed = False
+        # incremented whenever the data is changed, including partial writes that do not change the modified count.
+        self.__data_change_count = 0
         self.__pending_xdata_lock = threading.RLock()
         self.__pending_xdata: typing.Optional[DataAndMetadata.DataAndMetadata] = None
         self.__pending_queue: typing.List[typing.Tuple[DataAndMetadata.DataAndMetadata, typing.Sequence[slice], typing.Sequence[slice], DataAndMetadata.DataMetadata]] = list()
         self.__content_changed = False
-        # Python 3.9+: parameterized set, weakref
-        self.__display_data_channel_refs = set()  # type: ignore  # display data channels referencing this data item
+        # display data channels referencing this data item. entries drop out automatically if a display data channel
+        # goes away without being removed.
+        self.__display_data_channel_refs: weakref.WeakSet[DisplayItem.DisplayDataChannel] = weakref.WeakSet()
         if data is not None:
             data_and_metadata = DataAndMetadata.DataAndMetadata.from_data(data, timezone=self.timezone, timezone_offset=self.timezone_offset)
             self.increment_data_ref_count()
@@ -393,18 +396,18 @@ class DataItem(Persistence.PersistentObject):
 
     def add_display_data_channel(self, display_data_channel: DisplayItem.DisplayDataChannel) -> None:
         """Add a display data channel referencing this data item."""
-        self.__display_data_channel_refs.add(weakref.ref(display_data_channel))
+        self.__display_data_channel_refs.add(display_data_channel)
         self.notify_add_item("display_data_channels", display_data_channel)
 
     def remove_display_data_channel(self, display_data_channel: DisplayItem.DisplayDataChannel) -> None:
         """Remove a display data channel referencing this data item."""
-        self.__display_data_channel_refs.remove(weakref.ref(display_data_channel))
+        self.__display_data_channel_refs.remove(display_data_channel)
         self.notify_discard_item("display_data_channels", display_data_channel)
 
     @property
     def display_data_channels(self) -> typing.Set[DisplayItem.DisplayDataChannel]:
         """Return the list of display data channels referencing this data item."""
-        return {display_data_channel_ref() for display_data_channel_ref in self.__display_data_channel_refs}
+        return set(self.__display_data_channel_refs)
 
     @property
     def in_transaction_state(self) -> bool:
@@ -1095,6 +1098,7 @@ class DataItem(Persistence.PersistentObject):
             self.__set_data_metadata_direct(data_and_metadata.data_metadata, data_modified)
         self.__change_changed = True
         self.__change_data_changed = True
+        self.__data_change_count += 1
         if self._session_manager:
             session_id = self._session_manager.current_session_id
             self.session_id = session_id
@@ -1181,6 +1185,7 @@ class DataItem(Persistence.PersistentObject):
                     # mark changes and update session
                     self.__change_changed = True
                     self.__change_data_changed = True
+                    self.__data_change_count += 1
                     if self._session_manager:
                         session_id = self._session_manager.current_session_id
                         self.session_id = session_id
@@ -1192,6 +1197,10 @@ class DataItem(Persistence.PersistentObject):
             finally:
                 self.decrement_data_ref_count()
 
+    @property
+    def data_change_count(self) -> int:
+        return self.__data_change_count
+
     @property
     def data_shape(self) -> typing.Optional[DataAndMetadata.ShapeType]:
         return self.__data_metadata.data_shape if self.__data_metadata else None
@@ -345,6 +345,33 @@ class DisplayValues:
 
         weakref.finalize(self, finalize)
 
+    def _copy_display_data_from(self, display_values: DisplayValues) -> None:
+        """Reuse the element data, display data, data range, and data sample already computed in display_values.
+
+        The caller is responsible for ensuring display_values was made from the same data, indexes, slice, and complex
+        display type. The display limits, color map, brightness, contrast, and adjustments do not affect these values.
+
+        Only values that have already been computed are copied. If display_values is busy computing on another thread,
+        nothing is copied rather than waiting for it.
+        """
+        if display_values.__lock.acquire(blocking=False):
+            try:
+                with self.__lock:
+                    if not display_values.__element_data_and_metadata_dirty:
+                        self.__element_data_and_metadata = display_values.__element_data_and_metadata
+                        self.__element_data_and_metadata_dirty = False
+                    if not display_values.__display_data_and_metadata_dirty:
+                        self.__display_data_and_metadata = display_values.__display_data_and_metadata
+                        self.__display_data_and_metadata_dirty = False
+                    if not display_values.__data_range_dirty:
+                        self.__data_range = display_values.__data_range
+                        self.__data_range_dirty = False
+                    if not display_values.__data_sample_dirty:
+                        self.__data_sample = display_values.__data_sample
+                        self.__data_sample_dirty = False
+            finally:
+                display_values.__lock.release()
+
     @property
     def color_map_data(self) -> typing.Optional[_RGBA32Type]:
         return self.__color_map_data
@@ -394,12 +421,9 @@ class DisplayValues:
                 display_data_and_metadata = self.display_data_and_metadata
                 display_data = display_data_and_metadata.data if display_data_and_metadata else None
                 if display_data is not None and display_data.shape and self.__data_and_metadata:
-                    data_shape = self.__data_and_metadata.data_shape
-                    data_dtype = self.__data_and_metadata.data_dtype
-                    if Image.is_shape_and_dtype_rgb_type(data_shape, data_dtype):
+                    # only rgb data needs special handling; complex data has already been converted to scalar.
+                    if Image.is_shape_and_dtype_rgb_type(self.__data_and_metadata.data_shape, self.__data_and_metadata.data_dtype):
                         self.__data_range = (0, 255)
-                    elif Image.is_shape_and_dtype_complex_type(data_shape, data_dtype):
-                        self.__data_range = (numpy.amin(display_data), numpy.amax(display_data))
                     else:
                         self.__data_range = (numpy.amin(display_data), numpy.amax(display_data))
                 else:
@@ -429,12 +453,9 @@ class DisplayValues:
                 display_data_and_metadata = self.display_data_and_metadata
                 display_data = display_data_and_metadata.data if display_data_and_metadata else None
                 if display_data is not None and display_data.shape and self.__data_and_metadata:
-                    data_shape = self.__data_and_metadata.data_shape
-                    data_dtype = self.__data_and_metadata.data_dtype
-                    if Image.is_shape_and_dtype_rgb_type(data_shape, data_dtype):
-                        self.__data_sample = None
-                    elif Image.is_shape_and_dtype_complex_type(data_shape, data_dtype):
-                        self.__data_sample = numpy.sort(numpy.random.choice(display_data.reshape(numpy.prod(display_data.shape, dtype=numpy.uint64)), 200))
+                    # only complex data is sampled; rgb data is never complex, so it needs no separate check.
+                    if Image.is_shape_and_dtype_complex_type(self.__data_and_metadata.data_shape, self.__data_and_metadata.data_dtype):
+                        self.__data_sample = numpy.sort(numpy.random.choice(display_data.reshape(-1), 200))
                     else:
                         self.__data_sample = None
                 else:
@@ -466,12 +487,18 @@ class DisplayValues:
                 self.__normalized_data_and_metadata_dirty = False
                 display_data_and_metadata = self.display_data_and_metadata
                 display_range = self.display_range
-                if display_range is not None and display_data_and_metadata:
+                display_data = display_data_and_metadata.data if display_data_and_metadata else None
+                if display_range is not None and display_data_and_metadata and display_data is not None:
                     display_limit_low, display_limit_high = display_range
-                    # normalize the data to [0, 1].
+                    # normalize the data to [0, 1]. the offset allocates the result; the scale is applied in place
+                    # rather than allocating a second array.
                     m = 1 / (display_limit_high - display_limit_low) if display_limit_high != display_limit_low else 0.0
                     b = -display_limit_low
-                    self.__normalized_data_and_metadata = float(m) * (display_data_and_metadata + float(b))
+                    normalized_data = numpy.add(display_data, float(b))
+                    numpy.multiply(normalized_data, float(m), out=normalized_data)
+                    self.__normalized_data_and_metadata = DataAndMetadata.new_data_and_metadata(normalized_data,
+                                                                                                intensity_calibration=display_data_and_metadata.intensity_calibration,
+                                                                                                dimensional_calibrations=display_data_and_metadata.dimensional_calibrations)
             return self.__normalized_data_and_metadata
 
     @property
@@ -530,6 +557,19 @@ class DisplayValues:
 
 DisplayValuesSubscription = object
 
+# the display data channel properties that are inputs to display values. changes to other properties do not require
+# new display values.
+_DISPLAY_VALUES_PROPERTY_NAMES = frozenset({"sequence_index", "collection_index", "slice_center", "slice_width",
+                                            "complex_display_type", "display_limits", "brightness", "contrast",
+                                            "adjustments", "color_map_data"})
+
+# the display data channel properties that are only used for bookkeeping (implicit connections) and do not change
+# what the display item shows.
+_DISPLAY_DATA_CHANNEL_BOOKKEEPING_PROPERTY_NAMES = frozenset({"display_item"})
+
+# the display layer properties exchanged through display_layers_list.
+_DISPLAY_LAYER_PROPERTY_NAMES = ("data_row", "fill_color", "stroke_color", "label", "stroke_width")
+
 
 class DisplayDataChannel(Persistence.PersistentObject):
     _executor = concurrent.futures.ThreadPoolExecutor()
@@ -580,6 +620,9 @@ class DisplayDataChannel(Persistence.PersistentObject):
         self.__display_values_stream = Stream.ValueStream[DisplayValues]()
         self.__computed_display_values_stream = Stream.ValueStream[DisplayValues]()
         self.__computed_display_values_subscription_count = 0
+        # the inputs to the display data of the latest display values. used to reuse display data when only the
+        # display limits, color map, or other post display data properties change.
+        self.__display_data_key: typing.Optional[typing.Tuple[typing.Any, ...]] = None
 
         self.data_item_will_change_event = Event.Event()
         self.data_item_did_change_event = Event.Event()
@@ -1136,7 +1179,7 @@ class DisplayDataChannel(Persistence.PersistentObject):
     def __property_changed(self, property_name: str, value: typing.Any) -> None:
         # when one of the defined properties changes, this gets called
         self.notify_property_changed(property_name)
-        if property_name in ("sequence_index", "collection_index", "slice_center", "slice_width", "complex_display_type", "display_limits", "brightness", "contrast", "adjustments", "color_map_data"):
+        if property_name in _DISPLAY_VALUES_PROPERTY_NAMES:
             self.__queue_display_values_update()
 
     def save_properties(self) -> typing.Tuple[typing.Any, ...]:
@@ -1207,15 +1250,30 @@ class DisplayDataChannel(Persistence.PersistentObject):
 
         # make display values. this can be converted to a method as it gets more complicated.
         def make_display_values() -> typing.Optional[DisplayValues]:
-            if self.__data_item:
-                return DisplayValues(self.__data_item.xdata,
-                                     self.sequence_index,
-                                     self.collection_index,
-                                     self.slice_center, self.slice_width,
-                                     self.display_limits,
-                                     self.complex_display_type,
-                                     self.__color_map_data, self.brightness,
-                                     self.contrast, self.adjustments)
+            data_item = self.__data_item
+            if data_item:
+                # read the change counts before the data so that a concurrent change can only make the key older.
+                modified_count = data_item.modified_count
+                data_change_count = data_item.data_change_count
+                display_values = DisplayValues(data_item.xdata,
+                                               self.sequence_index,
+                                               self.collection_index,
+                                               self.slice_center, self.slice_width,
+                                               self.display_limits,
+                                               self.complex_display_type,
+                                               self.__color_map_data, self.brightness,
+                                               self.contrast, self.adjustments)
+                # if the data and the properties used to produce the display data are unchanged, reuse the display
+                # data from the previous display values instead of recomputing it.
+                display_data_key = (data_item, modified_count, data_change_count, self.sequence_index,
+                                    tuple(self.collection_index), self.slice_center, self.slice_width,
+                                    self.complex_display_type)
+                last_display_values = self.__display_values_stream.value
+                if last_display_values and display_data_key == self.__display_data_key:
+                    display_values._copy_display_data_from(last_display_values)
+                self.__display_data_key = display_data_key
+                return display_values
+            self.__display_data_key = None
             return None
 
         # the method to compute the display values on the background thread.
@@ -1379,6 +1437,10 @@ class DisplayItem(Persistence.PersistentObject):
         self.display_property_changed_event = Event.Event()
         self.display_changed_event = Event.Event()
 
+        # display_properties is copied on read; keep one copy for get_display_property. it is replaced (never filled
+        # lazily or mutated) by the changed callback, so readers on other threads cannot store a stale copy.
+        self.__display_properties_cache: Persistence.PersistentDictType = self.display_properties
+
         self.__cache = Cache.ShadowCache()
         self.__suspendable_storage_cache: typing.Optional[Cache.CacheLike] = None
 
@@ -1429,9 +1491,9 @@ class DisplayItem(Persistence.PersistentObject):
                 self.__outstanding_condition.wait()
         self.__graphic_selection_changed_event_listener.close()
         self.__graphic_selection_changed_event_listener = typing.cast(typing.Any, None)
-        for display_data_channel in copy.copy(self.display_data_channels):
+        for display_data_channel in self.display_data_channels:
             self.__disconnect_display_data_channel(display_data_channel, 0)
-        for graphic in copy.copy(self.graphics):
+        for graphic in self.graphics:
             self.__disconnect_graphic(graphic, 0)
         self.graphic_selection = typing.cast(typing.Any, None)
         super().close()
@@ -1501,15 +1563,15 @@ class DisplayItem(Persistence.PersistentObject):
 
     @property
     def graphics(self) -> typing.Sequence[Graphics.Graphic]:
-        return typing.cast(typing.Sequence[Graphics.Graphic], self._get_relationship_values("graphics"))
+        return typing.cast(typing.Sequence[Graphics.Graphic], self._get_relationship_values_snapshot("graphics"))
 
     @property
     def display_layers(self) -> typing.Sequence[DisplayLayer]:
-        return typing.cast(typing.Sequence[DisplayLayer], self._get_relationship_values("display_layers"))
+        return typing.cast(typing.Sequence[DisplayLayer], self._get_relationship_values_snapshot("display_layers"))
 
     @property
     def display_data_channels(self) -> typing.Sequence[DisplayDataChannel]:
-        return typing.cast(typing.Sequence[DisplayDataChannel], self._get_relationship_values("display_data_channels"))
+        return typing.cast(typing.Sequence[DisplayDataChannel], self._get_relationship_values_snapshot("display_data_channels"))
 
     def create_proxy(self) -> Persistence.PersistentObjectProxy[DisplayItem]:
         return self.project.create_item_proxy(item=self)
@@ -1564,6 +1626,7 @@ class DisplayItem(Persistence.PersistentObject):
             self.display_property_changed_event.fire("calibration_style_id")
 
     def __display_properties_changed(self, name: str, value: typing.Any) -> None:
+        self.__display_properties_cache = copy.deepcopy(value)
         self.notify_property_changed(name)
 
     def clone(self) -> DisplayItem:
@@ -1665,7 +1728,10 @@ class DisplayItem(Persistence.PersistentObject):
             self.__enter_write_delay_state()
 
     def get_display_property(self, property_name: str, default_value: typing.Any = None) -> typing.Any:
-        return self.display_properties.get(property_name, default_value)
+        display_properties = self.__display_properties_cache
+        if property_name in display_properties:
+            return copy.deepcopy(display_properties[property_name])
+        return default_value
 
     def set_display_property(self, property_name: str, value: typing.Any) -> None:
         display_properties = self.display_properties
@@ -1707,28 +1773,32 @@ class DisplayItem(Persistence.PersistentObject):
 
     @property
     def display_layers_list(self) -> typing.List[Persistence.PersistentDictType]:
-        properties = ["data_row", "fill_color", "stroke_color", "label", "stroke_width"]
+        # this is called for every display change; read the display data channels once and look up their
+        # indexes from a dict rather than copying and scanning the list for each layer.
+        display_data_channel_indexes = {id(display_data_channel): index for index, display_data_channel in enumerate(self.display_data_channels)}
         l = list()
         for display_layer in self.display_layers:
             d = dict()
-            for property in properties:
+            for property in _DISPLAY_LAYER_PROPERTY_NAMES:
                 value = getattr(display_layer, property, None)
                 if value is not None:
                     d[property] = value
             # the check for display data channel still being in display data channels is a hack needed because the
             # removal of a display layer can cascade remove a display data channel and leave the display data channel
             # of the display layer dangling during the cascade. hack it here.
-            if display_layer.display_data_channel and display_layer.display_data_channel in self.display_data_channels:
-                d["data_index"] = self.display_data_channels.index(display_layer.display_data_channel)
+            display_data_channel = display_layer.display_data_channel
+            if display_data_channel:
+                data_index = display_data_channel_indexes.get(id(display_data_channel))
+                if data_index is not None:
+                    d["data_index"] = data_index
             l.append(d)
         return l
 
     @display_layers_list.setter
     def display_layers_list(self, value: typing.List[Persistence.PersistentDictType]) -> None:
         assert len(value) == len(self.display_layers)
-        properties = ["data_row", "fill_color", "stroke_color", "label", "stroke_width"]
         for index, (display_layer, display_layer_dict) in enumerate(zip(self.display_layers, value)):
-            for property in properties:
+            for property in _DISPLAY_LAYER_PROPERTY_NAMES:
                 if not property in display_layer_dict:
                     display_layer_dict[property] = None
             self._set_display_layer_properties(index, **display_layer_dict)
@@ -1737,7 +1807,11 @@ class DisplayItem(Persistence.PersistentObject):
         return getattr(self.display_layers[index], property_name, default_value)
 
     def _set_display_layer_property(self, index: int, property_name: str, value: typing.Any) -> None:
-        setattr(self.display_layers[index], property_name, value)
+        # setting a display layer property always notifies, marks the layer modified, and writes it; skip values that
+        # have not changed so that writing back a whole display layers list only notifies for the actual changes.
+        display_layer = self.display_layers[index]
+        if getattr(display_layer, property_name, None) != value:
+            setattr(display_layer, property_name, value)
 
     def _set_display_layer_properties(self, index: int, **kwargs: typing.Any) -> None:
         for kw, v in kwargs.items():
@@ -1903,7 +1977,8 @@ class DisplayItem(Persistence.PersistentObject):
         self.notify_property_changed("displayed_title")
 
     def __display_channel_property_changed(self, name: str) -> None:
-        self.display_changed_event.fire()
+        if name not in _DISPLAY_DATA_CHANNEL_BOOKKEEPING_PROPERTY_NAMES:
+            self.display_changed_event.fire()
 
     @property
     def display_data_channel(self) -> typing.Optional[DisplayDataChannel]:
@@ -2160,8 +2235,14 @@ class DisplayItem(Persistence.PersistentObject):
 
     @property
     def data_item(self) -> typing.Optional[DataItem.DataItem]:
-        data_items = self.data_items
-        return data_items[0] if len(data_items) == 1 else None
+        # equivalent to checking data_items, without building the list.
+        data_item: typing.Optional[DataItem.DataItem] = None
+        for display_data_channel in self.display_data_channels:
+            if display_data_channel.data_item:
+                if data_item:
+                    return None
+                data_item = display_data_channel.data_item
+        return data_item
 
     @property
     def selected_graphics(self) -> typing.Sequence[Graphics.Graphic]:
@@ -2179,9 +2260,8 @@ class DisplayItem(Persistence.PersistentObject):
         self.notify_remove_item("graphics", graphic, index)
 
     def __disconnect_graphic(self, graphic: Graphics.Graphic, index: int) -> None:
-        graphic_changed_listener = self.__graphic_changed_listeners[index]
-        graphic_changed_listener.close()
-        self.__graphic_changed_listeners.remove(graphic_changed_listener)
+        self.__graphic_changed_listeners[index].close()
+        del self.__graphic_changed_listeners[index]
         self.graphic_selection.remove_index(index)
         self.__graphic_changed(graphic)
 
@@ -2200,6 +2280,11 @@ class DisplayItem(Persistence.PersistentObject):
     # this message comes from the graphic. the connection is established when a graphic
     # is added or removed from this object.
     def __graphic_changed(self, graphic: Graphics.Graphic) -> None:
+        # while changes are batched (for instance, during a drag), skip the notification; ending the batch
+        # updates the displays, which notifies graphics changed once for all of the changes.
+        with self.__display_item_change_count_lock:
+            if self.__display_item_change_count > 0:
+                return
         self.graphics_changed_event.fire(self.graphic_selection)
 
     @property
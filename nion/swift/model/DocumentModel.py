@@ -404,7 +404,7 @@ class GraphicsController(ItemsController):
         return item.container
 
     def item_index(self, graphic: Persistence.PersistentObject) -> int:
-        return typing.cast(Graphics.Graphic, graphic).display_item.graphics.index(graphic)
+        return typing.cast(Graphics.Graphic, graphic).display_item.item_index("graphics", graphic)
 
     def save_item_order(self) -> typing.List[Persistence.PersistentObjectSpecifier]:
         return list()
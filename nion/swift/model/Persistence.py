@@ -12,6 +12,7 @@ import json
 import logging
 import operator
 import re
+import threading
 import traceback
 import typing
 import uuid
@@ -221,11 +222,65 @@ class PersistentRelationship:
         self.hidden = hidden
         self.values: typing.List[PersistentObject] = list()
         self.index: typing.Dict[uuid.UUID, PersistentObject] = dict()
+        # the snapshot is built on the first read after the values change. the positions are maintained incrementally
+        # for appends and removals at the end (loading, undo/redo) and otherwise rebuilt on the next lookup. both are
+        # built and invalidated under the lock, and invalidated only after values has been changed, so a reader on
+        # another thread cannot store a copy that is out of date.
+        self.__values_snapshot: typing.Optional[typing.Tuple[PersistentObject, ...]] = tuple()
+        self.__values_positions: typing.Optional[typing.Dict[uuid.UUID, int]] = dict()
+        self.__values_lock = threading.RLock()
 
     def close(self) -> None:
         self.insert = None
         self.remove = None
 
+    @property
+    def values_snapshot(self) -> typing.Tuple[PersistentObject, ...]:
+        values_snapshot = self.__values_snapshot
+        if values_snapshot is None:
+            with self.__values_lock:
+                values_snapshot = self.__values_snapshot
+                if values_snapshot is None:
+                    values_snapshot = tuple(self.values)
+                    self.__values_snapshot = values_snapshot
+        return values_snapshot
+
+    def values_inserted(self, before_index: int, item: PersistentObject) -> None:
+        """Update the derived state after item has been inserted into values at before_index."""
+        with self.__values_lock:
+            values_positions = self.__values_positions
+            if values_positions is not None and before_index == len(self.values) - 1:
+                values_positions[item.uuid] = before_index
+            else:
+                self.__values_positions = None
+            self.__values_snapshot = None
+
+    def values_removed(self, index: int, item: PersistentObject) -> None:
+        """Update the derived state after item has been removed from values at index."""
+        with self.__values_lock:
+            values_positions = self.__values_positions
+            if values_positions is not None and index == len(self.values):
+                values_positions.pop(item.uuid, None)
+            else:
+                self.__values_positions = None
+            self.__values_snapshot = None
+
+    def index_of(self, item: PersistentObject) -> int:
+        # positions are looked up by uuid so repeated index lookups (undo/redo bookkeeping, selections) do not
+        # scan the list each time. fall back to a scan if the position is not (or no longer) valid.
+        values_positions = self.__values_positions
+        if values_positions is None:
+            with self.__values_lock:
+                values_positions = self.__values_positions
+                if values_positions is None:
+                    values_positions = {value.uuid: index for index, value in enumerate(self.values)}
+                    self.__values_positions = values_positions
+        index = values_positions.get(item.uuid)
+        values = self.values
+        if index is None or index >= len(values) or values[index] is not item:
+            return values.index(item)
+        return index
+
     @property
     def storage_key(self) -> str:
         return self.key if self.key else self.name
@@ -1073,6 +1128,10 @@ class PersistentObject(Observable.Observable):
     def _get_relationship_values(self, name: str) -> typing.Sequence[typing.Any]:
         return copy.copy(self.__relationships[name].values)
 
+    def _get_relationship_values_snapshot(self, name: str) -> typing.Sequence[typing.Any]:
+        """Return an immutable snapshot of the relationship values, shared until the relationship changes."""
+        return self.__relationships[name].values_snapshot
+
     def _is_persistent_property_recordable(self, name: str) -> bool:
         property = self.__properties.get(name)
         return (property.recordable and not property.read_only) if (property is not None) else False
@@ -1117,6 +1176,7 @@ class PersistentObject(Observable.Observable):
         """ Load item in persistent storage and then into relationship storage, but don't update modified or notify persistent storage. """
         relationship = self.__relationships[name]
         relationship.values.insert(before_index, item)
+        relationship.values_inserted(before_index, item)
         relationship.index[item.uuid] = item
         item.about_to_be_inserted(self)
         item.persistent_object_parent = PersistentObjectParent(self, relationship_name=name)
@@ -1131,6 +1191,7 @@ class PersistentObject(Observable.Observable):
         """ Unload item from relationship storage and persistent storage, but don't update modified or notify persistent storage. """
         relationship = self.__relationships[name]
         item = relationship.values.pop(index)
+        relationship.values_removed(index, item)
         relationship.index.pop(item.uuid)
         item.about_to_be_removed(self)
         if relationship.remove:
@@ -1145,6 +1206,7 @@ class PersistentObject(Observable.Observable):
         """ Insert item in persistent storage and then into relationship storage and notify. """
         relationship = self.__relationships[name]
         relationship.values.insert(before_index, item)
+        relationship.values_inserted(before_index, item)
         relationship.index[item.uuid] = item
         self.__update_modified(DateTime.utcnow())
         item.persistent_object_parent = PersistentObjectParent(self, relationship_name=name)
@@ -1168,6 +1230,7 @@ class PersistentObject(Observable.Observable):
         relationship = self.__relationships[name]
         item_index = relationship.values.index(item)
         relationship.values.remove(item)
+        relationship.values_removed(item_index, item)
         relationship.index.pop(item.uuid)
         self.__update_modified(DateTime.utcnow())
         if relationship.remove:
@@ -1192,7 +1255,7 @@ class PersistentObject(Observable.Observable):
     def item_index(self, name: str, item: PersistentObject) -> int:
         """Return the index of item within the relationship specified by name."""
         relationship = self.__relationships[name]
-        return relationship.values.index(item)
+        return relationship.index_of(item)
 
     def get_item_by_uuid(self, name: str, uuid: uuid.UUID) -> typing.Optional[PersistentObject]:
         """Return the item from the index by uuid."""
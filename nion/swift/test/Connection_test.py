@@ -1,6 +1,7 @@
 # standard libraries
 import contextlib
 import logging
+import threading
 import unittest
 
 # third party libraries
@@ -13,6 +14,7 @@ from nion.swift.model import Connection
 from nion.swift.model import DataItem
 from nion.swift.model import DocumentModel
 from nion.swift.model import Graphics
+from nion.swift.model import Persistence
 from nion.swift.model import Symbolic
 from nion.swift.test import TestContext
 from nion.ui import TestUI
@@ -22,6 +24,28 @@ def create_memory_profile_context() -> TestContext.MemoryProfileContext:
     return TestContext.MemoryProfileContext()
 
 
+class ValueObject(Persistence.PersistentObject):
+    """A persistent object whose value setter always notifies and records each value it is given."""
+
+    def __init__(self, value=None, on_set=None):
+        super().__init__()
+        self.__value = value
+        self.on_set = on_set
+        self.set_values = list()
+
+    @property
+    def value(self):
+        return self.__value
+
+    @value.setter
+    def value(self, value):
+        self.__value = value
+        self.set_values.append(value)
+        if callable(self.on_set):
+            self.on_set(value)
+        self.notify_property_changed("value")
+
+
 class TestConnectionClass(unittest.TestCase):
 
     def setUp(self):
@@ -174,6 +198,162 @@ class TestConnectionClass(unittest.TestCase):
             self.assertEqual(len(interval_descriptors), 1)
             self.assertEqual(interval_descriptors[0]["interval"], interval)
 
+    def test_interval_list_connection_updates_only_mutated_interval_descriptor(self):
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            data_item_2d = DataItem.DataItem(numpy.zeros((8, 8), numpy.uint32))
+            data_item_1d = DataItem.DataItem(numpy.zeros((8, ), numpy.uint32))
+            document_model.append_data_item(data_item_2d)
+            document_model.append_data_item(data_item_1d)
+            display_item_2d = document_model.get_display_item_for_data_item(data_item_2d)
+            display_item_1d = document_model.get_display_item_for_data_item(data_item_1d)
+            line_profile_graphic = Graphics.LineProfileGraphic()
+            display_item_2d.add_graphic(line_profile_graphic)
+            interval_region1 = Graphics.IntervalGraphic()
+            interval_region1.interval = 0.1, 0.2
+            display_item_1d.add_graphic(interval_region1)
+            interval_region2 = Graphics.IntervalGraphic()
+            interval_region2.interval = 0.4, 0.5
+            display_item_1d.add_graphic(interval_region2)
+            connection = Connection.IntervalListConnection(display_item_1d, line_profile_graphic)
+            document_model.append_connection(connection)
+            changed_property_names = list()
+            def property_changed(name: str) -> None:
+                changed_property_names.append(name)
+            with contextlib.closing(line_profile_graphic.property_changed_event.listen(property_changed)):
+                interval_region2.label = "label"
+                self.assertNotIn("interval_descriptors", changed_property_names)
+                interval_region2.interval = 0.6, 0.7
+                self.assertEqual(1, changed_property_names.count("interval_descriptors"))
+            self.assertEqual([(0.1, 0.2), (0.6, 0.7)], [d["interval"] for d in line_profile_graphic.interval_descriptors])
+
+    def test_interval_list_connection_propagates_only_interval_changes_of_each_region(self):
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            data_item_2d = DataItem.DataItem(numpy.zeros((8, 8), numpy.uint32))
+            data_item_1d = DataItem.DataItem(numpy.zeros((8, ), numpy.uint32))
+            document_model.append_data_item(data_item_2d)
+            document_model.append_data_item(data_item_1d)
+            display_item_2d = document_model.get_display_item_for_data_item(data_item_2d)
+            display_item_1d = document_model.get_display_item_for_data_item(data_item_1d)
+            line_profile_graphic = Graphics.LineProfileGraphic()
+            display_item_2d.add_graphic(line_profile_graphic)
+            interval_regions = list()
+            for interval in ((0.1, 0.2), (0.3, 0.4), (0.5, 0.6)):
+                interval_region = Graphics.IntervalGraphic()
+                interval_region.interval = interval
+                display_item_1d.add_graphic(interval_region)
+                interval_regions.append(interval_region)
+            connection = Connection.IntervalListConnection(display_item_1d, line_profile_graphic)
+            document_model.append_connection(connection)
+            region_listeners = [list(interval_region.property_changed_event.listeners) for interval_region in interval_regions]
+            changed_property_names = list()
+            with contextlib.closing(line_profile_graphic.property_changed_event.listen(changed_property_names.append)):
+                interval_regions[1].label = "label"
+                interval_regions[1].color = "#0F0"
+                self.assertNotIn("interval_descriptors", changed_property_names)
+                interval_regions[1].start = 0.35
+                self.assertEqual(1, changed_property_names.count("interval_descriptors"))
+            self.assertEqual([(0.1, 0.2), (0.35, 0.4), (0.5, 0.6)], [d["interval"] for d in line_profile_graphic.interval_descriptors])
+            # the regions keep their listeners; a change is applied without rebuilding the connection state.
+            self.assertEqual(region_listeners, [list(interval_region.property_changed_event.listeners) for interval_region in interval_regions])
+
+    def test_interval_list_connection_keeps_interval_descriptors_in_graphic_order(self):
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            data_item_2d = DataItem.DataItem(numpy.zeros((8, 8), numpy.uint32))
+            data_item_1d = DataItem.DataItem(numpy.zeros((8, ), numpy.uint32))
+            document_model.append_data_item(data_item_2d)
+            document_model.append_data_item(data_item_1d)
+            display_item_2d = document_model.get_display_item_for_data_item(data_item_2d)
+            display_item_1d = document_model.get_display_item_for_data_item(data_item_1d)
+            line_profile_graphic = Graphics.LineProfileGraphic()
+            display_item_2d.add_graphic(line_profile_graphic)
+            connection = Connection.IntervalListConnection(display_item_1d, line_profile_graphic)
+            document_model.append_connection(connection)
+            interval_region1 = Graphics.IntervalGraphic()
+            interval_region1.interval = 0.1, 0.2
+            display_item_1d.add_graphic(interval_region1)
+            display_item_1d.add_graphic(Graphics.ChannelGraphic())
+            interval_region2 = Graphics.IntervalGraphic()
+            interval_region2.interval = 0.3, 0.4
+            display_item_1d.insert_graphic(0, interval_region2)
+            self.assertEqual([(0.3, 0.4), (0.1, 0.2)], [d["interval"] for d in line_profile_graphic.interval_descriptors])
+            display_item_1d.remove_graphic(interval_region2).close()
+            interval_region1.interval = 0.5, 0.6
+            self.assertEqual([(0.5, 0.6)], [d["interval"] for d in line_profile_graphic.interval_descriptors])
+
+    def test_property_connection_does_not_set_target_to_value_it_already_has(self):
+        source = ValueObject(1)
+        target = ValueObject(0)
+        connection = Connection.PropertyConnection(source, "value", target, "value")
+        with contextlib.closing(connection), contextlib.closing(source), contextlib.closing(target):
+            self.assertEqual([1], target.set_values)
+            property_changed_names = list()
+            with target.property_changed_event.listen(property_changed_names.append):
+                source.value = 1
+                self.assertEqual([1], target.set_values)
+                self.assertEqual([], property_changed_names)
+                source.value = 2
+                self.assertEqual([1, 2], target.set_values)
+                self.assertEqual(["value"], property_changed_names)
+
+    def test_property_connection_propagates_array_values(self):
+        source = ValueObject(numpy.zeros(2))
+        target = ValueObject()
+        connection = Connection.PropertyConnection(source, "value", target, "value")
+        with contextlib.closing(connection), contextlib.closing(source), contextlib.closing(target):
+            self.assertEqual(1, len(target.set_values))
+            source.value = numpy.ones(2)
+            self.assertEqual(2, len(target.set_values))
+            self.assertTrue(numpy.array_equal(numpy.ones(2), target.value))
+
+    def test_property_connection_propagates_from_second_thread_while_first_thread_propagates(self):
+        entered_event = threading.Event()
+        release_event = threading.Event()
+
+        def on_set(value):
+            if value == 2:
+                entered_event.set()
+                release_event.wait(10.0)
+
+        source = ValueObject(1)
+        target = ValueObject(0, on_set)
+        connection = Connection.PropertyConnection(source, "value", target, "value")
+        with contextlib.closing(connection), contextlib.closing(source), contextlib.closing(target):
+            thread = threading.Thread(target=setattr, args=(source, "value", 2))
+            thread.start()
+            try:
+                self.assertTrue(entered_event.wait(10.0))
+                # the other thread is blocked while setting the target; a change on this thread still propagates.
+                source.value = 3
+                self.assertEqual(3, target.set_values[-1])
+            finally:
+                release_event.set()
+                thread.join()
+            self.assertEqual([1, 2, 3], target.set_values)
+
+    def test_cloned_property_connection_has_same_uuid_and_properties(self):
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            data_item_3d = DataItem.DataItem(numpy.zeros((8, 8, 32), numpy.uint32))
+            data_item_1d = DataItem.DataItem(numpy.zeros((32,), numpy.uint32))
+            document_model.append_data_item(data_item_3d)
+            document_model.append_data_item(data_item_1d)
+            display_item_1d = document_model.get_display_item_for_data_item(data_item_1d)
+            display_item_3d = document_model.get_display_item_for_data_item(data_item_3d)
+            interval = Graphics.IntervalGraphic()
+            display_item_1d.add_graphic(interval)
+            connection = Connection.PropertyConnection(display_item_3d.display_data_channels[0], "slice_center", interval, "start", parent=data_item_1d)
+            document_model.append_connection(connection)
+            connection_clone = connection.clone()
+            try:
+                self.assertIsInstance(connection_clone, Connection.PropertyConnection)
+                self.assertEqual(connection.uuid, connection_clone.uuid)
+                self.assertEqual(connection.write_to_dict(), connection_clone.write_to_dict())
+            finally:
+                connection_clone.close()
+
     def test_connection_establishes_transaction_on_source(self):
         with TestContext.create_memory_context() as test_context:
             document_model = test_context.create_document_model()
@@ -0,0 +1,89 @@
+# standard libraries
+import sys
+import unittest
+
+# third party libraries
+# None
+
+# local libraries
+from nion.swift import ConsoleDialog
+
+
+class TestConsoleDialogClass(unittest.TestCase):
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_execute_lines_runs_block_in_console_namespace(self):
+        locals = dict()
+        state_controller = ConsoleDialog.ConsoleWidgetStateController(locals)
+        result, error_code = state_controller.execute_lines(["x = 1", "def f(a):", "  return a + x", "", "y = f(2)"])
+        self.assertEqual(0, error_code)
+        self.assertEqual(3, locals["y"])
+        self.assertFalse(state_controller.incomplete)
+
+    def test_execute_lines_reports_failing_statement_and_runs_each_statement_once(self):
+        locals = {"calls": list()}
+        state_controller = ConsoleDialog.ConsoleWidgetStateController(locals)
+        result, error_code = state_controller.execute_lines(["calls.append(1)", "1 / 0", "calls.append(2)"])
+        self.assertEqual(-1, error_code)
+        self.assertIn("ZeroDivisionError", result)
+        self.assertEqual([1, 2], locals["calls"])
+
+    def test_execute_lines_adds_lines_to_history(self):
+        state_controller = ConsoleDialog.ConsoleWidgetStateController(dict())
+        state_controller.execute_lines(["a = 1", "", "b = 2"])
+        self.assertEqual("b = 2", state_controller.move_back_in_history(str()))
+        self.assertEqual("a = 1", state_controller.move_back_in_history(str()))
+
+    def test_execute_lines_falls_back_to_interpreting_lines_when_block_is_invalid(self):
+        locals = dict()
+        state_controller = ConsoleDialog.ConsoleWidgetStateController(locals)
+        result, error_code = state_controller.execute_lines(["a = 1", "b = )"])
+        self.assertEqual(-1, error_code)
+        self.assertIn("SyntaxError", result)
+        self.assertEqual(1, locals["a"])
+        self.assertEqual("b = )", state_controller.move_back_in_history(str()))
+
+    def test_interpret_command_prints_expression_value(self):
+        state_controller = ConsoleDialog.ConsoleWidgetStateController(dict())
+        self.assertEqual(("3\n", 0), state_controller.interpret_command("1 + 2"))
+        self.assertFalse(state_controller.incomplete)
+
+    def test_interpret_command_reports_syntax_error(self):
+        state_controller = ConsoleDialog.ConsoleWidgetStateController(dict())
+        result, error_code = state_controller.interpret_command("x = )")
+        self.assertEqual(-1, error_code)
+        self.assertIn("SyntaxError", result)
+        self.assertFalse(state_controller.incomplete)
+
+    def test_interpret_command_runs_incomplete_input_once_when_block_completes(self):
+        locals = {"calls": list()}
+        state_controller = ConsoleDialog.ConsoleWidgetStateController(locals)
+        state_controller.interpret_command("calls.append(1)")
+        self.assertEqual([1], locals["calls"])
+        state_controller.interpret_command("for i in range(2):")
+        self.assertTrue(state_controller.incomplete)
+        state_controller.interpret_command("    calls.append(2)")
+        self.assertTrue(state_controller.incomplete)
+        self.assertEqual([1], locals["calls"])
+        self.assertEqual(("", 0), state_controller.interpret_command(""))
+        self.assertFalse(state_controller.incomplete)
+        self.assertEqual([1, 2, 2], locals["calls"])
+
+    def test_interpret_command_propagates_system_exit_and_restores_streams(self):
+        state_controller = ConsoleDialog.ConsoleWidgetStateController(dict())
+        stdout, stderr = sys.stdout, sys.stderr
+        with self.assertRaises(SystemExit):
+            state_controller.interpret_command("raise SystemExit")
+        self.assertIs(stdout, sys.stdout)
+        self.assertIs(stderr, sys.stderr)
+
+    def test_interpret_command_keeps_future_imports_for_later_commands(self):
+        state_controller = ConsoleDialog.ConsoleWidgetStateController(dict())
+        self.assertEqual(("", 0), state_controller.interpret_command("from __future__ import annotations"))
+        # the annotation is only valid if it is not evaluated
+        self.assertEqual(("", 0), state_controller.interpret_command("def f(a: undefined_name) -> None: pass"))
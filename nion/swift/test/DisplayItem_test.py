@@ -408,6 +408,43 @@ class TestDisplayItemClass(unittest.TestCase):
                 display_layer.fill_color = "red"
             self.assertTrue(property_did_change)
 
+    def test_get_display_property_returns_copy_of_current_value_or_default_unchanged(self):
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            data_item = DataItem.DataItem(numpy.zeros((8, )))
+            document_model.append_data_item(data_item)
+            display_item = document_model.get_display_item_for_data_item(data_item)
+            default_value = ["default"]
+            self.assertIs(default_value, display_item.get_display_property("y_style", default_value))
+            display_item.set_display_property("y_style", "log")
+            self.assertEqual("log", display_item.get_display_property("y_style", default_value))
+            display_item.display_properties = {"y_style": "linear", "channels": [0, 1]}
+            self.assertEqual("linear", display_item.get_display_property("y_style"))
+            # the returned value is a copy; modifying it does not change the display properties
+            display_item.get_display_property("channels").append(2)
+            self.assertEqual([0, 1], display_item.get_display_property("channels"))
+            display_item.set_display_property("y_style", None)
+            self.assertIs(default_value, display_item.get_display_property("y_style", default_value))
+
+    def test_setting_display_layers_list_only_notifies_changed_display_layer_properties(self):
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            data_item = DataItem.DataItem(numpy.zeros((8, )))
+            document_model.append_data_item(data_item)
+            display_item = document_model.get_display_item_for_data_item(data_item)
+            display_layer = typing.cast(DisplayItem.DisplayLayer, display_item.display_layers[0])
+            changed_property_names = list()
+            def property_changed(name: str) -> None:
+                changed_property_names.append(name)
+            with contextlib.closing(display_layer.property_changed_event.listen(property_changed)):
+                display_layers_list = display_item.display_layers_list
+                display_item.display_layers_list = display_layers_list
+                self.assertEqual([], changed_property_names)
+                display_layers_list[0]["fill_color"] = "red"
+                display_item.display_layers_list = display_layers_list
+                self.assertEqual(["fill_color"], changed_property_names)
+            self.assertEqual("red", display_layer.fill_color)
+
     def test_display_layer_property_reloads_after_change(self):
         with create_memory_profile_context() as profile_context:
             document_model = profile_context.create_document_model(auto_close=False)
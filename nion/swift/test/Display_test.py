@@ -171,6 +171,43 @@ class TestDisplayClass(unittest.TestCase):
             self.assertEqual(display_data_channel.get_latest_computed_display_values().display_range, (1, 1))
             self.assertEqual(display_data_channel.get_latest_computed_display_values().data_range, (1, 1))
 
+    def test_changing_display_limits_reuses_display_data_until_data_changes(self):
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            irow, icol = numpy.ogrid[0:16, 0:16]
+            data_item = DataItem.DataItem(icol)
+            document_model.append_data_item(data_item)
+            display_item = document_model.get_display_item_for_data_item(data_item)
+            display_data_channel = display_item.display_data_channels[0]
+            display_data_and_metadata = display_data_channel.get_latest_computed_display_values().display_data_and_metadata
+            display_data_channel.display_limits = (2, 12)
+            display_values = display_data_channel.get_latest_computed_display_values()
+            self.assertIs(display_data_and_metadata, display_values.display_data_and_metadata)
+            self.assertEqual(display_values.display_range, (2, 12))
+            self.assertEqual(display_values.data_range, (0, 15))
+            display_item.data_item.set_data(irow // 2 + 4)
+            display_values = display_data_channel.get_latest_computed_display_values()
+            self.assertIsNot(display_data_and_metadata, display_values.display_data_and_metadata)
+            self.assertEqual(display_values.data_range, (4, 11))
+
+    def test_graphic_changes_within_display_item_changes_notify_graphics_changed_once(self):
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            data_item = DataItem.DataItem(numpy.zeros((8, 8), numpy.uint32))
+            document_model.append_data_item(data_item)
+            display_item = document_model.get_display_item_for_data_item(data_item)
+            rect_graphic = Graphics.RectangleGraphic()
+            display_item.add_graphic(rect_graphic)
+            graphics_changed_count = [0]
+            def graphics_changed(graphic_selection):
+                graphics_changed_count[0] += 1
+            with contextlib.closing(display_item.graphics_changed_event.listen(graphics_changed)):
+                with display_item.display_item_changes():
+                    rect_graphic.bounds = ((0.1, 0.1), (0.2, 0.2))
+                    rect_graphic.bounds = ((0.2, 0.2), (0.3, 0.3))
+                    self.assertEqual(graphics_changed_count[0], 0)
+                self.assertEqual(graphics_changed_count[0], 1)
+
     def test_changing_data_notifies_data_and_display_range_change(self):
         with TestContext.create_memory_context() as test_context:
             document_model = test_context.create_document_model()
@@ -577,6 +614,23 @@ class TestDisplayClass(unittest.TestCase):
             display_data_channel.complex_display_type = "absolute"
             self.assertEqual(display_data_channel.get_latest_computed_display_values().display_range, (0, 5))
 
+    def test_display_values_after_partial_data_write_reflect_new_data_when_display_limits_change(self):
+        with TestContext.create_memory_context() as test_context:
+            document_model = test_context.create_document_model()
+            data_item = DataItem.DataItem(numpy.zeros((4, 4)))
+            document_model.append_data_item(data_item)
+            display_item = document_model.get_display_item_for_data_item(data_item)
+            display_data_channel = display_item.display_data_channels[0]
+            self.assertEqual((0.0, 0.0), display_data_channel.get_latest_computed_display_values().data_range)
+            # a partial write without metadata update changes the data but not the modified count
+            fives = DataAndMetadata.new_data_and_metadata(numpy.full((4, 4), 5.0))
+            with data_item.data_ref():
+                data_item.set_data_and_metadata_partial(data_item.xdata.data_metadata, fives, [slice(0, 4), slice(0, 4)], [slice(0, 4), slice(0, 4)])
+            display_data_channel.display_limits = (0, 1)
+            display_values = display_data_channel.get_latest_computed_display_values()
+            self.assertEqual((5.0, 5.0), display_values.data_range)
+            self.assertTrue(numpy.array_equal(numpy.full((4, 4), 5.0), display_values.display_data_and_metadata.data))
+
     def test_display_range_is_correct_on_complex_data_display_as_log_absolute(self):
         with TestContext.create_memory_context() as test_context:
             document_model = test_context.create_document_model()
@@ -206,3 +206,51 @@ class TestPersistentObjectContextClass(unittest.TestCase):
             object1.persistent_object_context = None
             self.assertEqual(1, r_count)
             self.assertEqual(0, u_count)  # parent was already unregistered
+
+    def test_relationship_values_snapshot_tracks_inserts_and_removes(self):
+        persistent_object = Persistence.PersistentObject()
+        persistent_object.define_relationship("items", lambda lookup_id: Persistence.PersistentObject(), hidden=True)
+        with contextlib.closing(persistent_object):
+            item0 = Persistence.PersistentObject()
+            item1 = Persistence.PersistentObject()
+            item2 = Persistence.PersistentObject()
+            self.assertEqual(tuple(), persistent_object._get_relationship_values_snapshot("items"))
+            persistent_object.append_item("items", item0)
+            persistent_object.append_item("items", item1)
+            snapshot = persistent_object._get_relationship_values_snapshot("items")
+            self.assertEqual((item0, item1), snapshot)
+            # the snapshot is shared until the relationship changes
+            self.assertIs(snapshot, persistent_object._get_relationship_values_snapshot("items"))
+            persistent_object.insert_item("items", 1, item2)
+            self.assertEqual((item0, item1), snapshot)
+            self.assertEqual((item0, item2, item1), persistent_object._get_relationship_values_snapshot("items"))
+            persistent_object.remove_item("items", item0)
+            self.assertEqual((item2, item1), persistent_object._get_relationship_values_snapshot("items"))
+
+    def test_relationship_item_index_tracks_inserts_and_removes(self):
+        persistent_object = Persistence.PersistentObject()
+        persistent_object.define_relationship("items", lambda lookup_id: Persistence.PersistentObject(), hidden=True)
+        with contextlib.closing(persistent_object):
+            item0 = Persistence.PersistentObject()
+            item1 = Persistence.PersistentObject()
+            item2 = Persistence.PersistentObject()
+            persistent_object.append_item("items", item0)
+            persistent_object.append_item("items", item1)
+            self.assertEqual([0, 1], [persistent_object.item_index("items", item) for item in (item0, item1)])
+            persistent_object.insert_item("items", 0, item2)
+            self.assertEqual([0, 1, 2], [persistent_object.item_index("items", item) for item in (item2, item0, item1)])
+            persistent_object.remove_item("items", item0)
+            self.assertEqual([0, 1], [persistent_object.item_index("items", item) for item in (item2, item1)])
+
+    def test_relationship_item_index_tracks_appends_and_removals_at_end(self):
+        persistent_object = Persistence.PersistentObject()
+        persistent_object.define_relationship("items", lambda lookup_id: Persistence.PersistentObject(), hidden=True)
+        with contextlib.closing(persistent_object):
+            items = [Persistence.PersistentObject() for _ in range(4)]
+            for index, item in enumerate(items):
+                persistent_object.append_item("items", item)
+                self.assertEqual(index, persistent_object.item_index("items", item))
+            persistent_object.remove_item("items", items[-1])
+            persistent_object.append_item("items", Persistence.PersistentObject())
+            self.assertEqual([0, 1, 2], [persistent_object.item_index("items", item) for item in items[:3]])
+            self.assertEqual(3, persistent_object.item_index("items", persistent_object._get_relationship_values_snapshot("items")[-1]))